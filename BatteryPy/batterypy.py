@@ -32,6 +32,7 @@ Licens : MIT
 
 # IMPORTS
 import sys
+import os
 from exceptions import *
 
 # DECLARE BASIC VARIABLES
@@ -48,10 +49,6 @@ class BatteryPy:
     def get_csv_report(self, path: str) -> None:
         """ This method will save the battery info in csv"""
 
-    def _get_file_content(self, file_path: str) -> str:
-        """ This method will read the given file path and return its content"""
-        return open(file_path, 'r', buffering=1).read()
-
 
 
 if sys.platform == "win32":
@@ -67,6 +64,9 @@ elif sys.platform == "linux":
         def __init__(self) -> None:
             super(Battery, self).__init__()
 
+            # Define the files that are kept open between reads as {file path: file descriptor}
+            self._opened_files: dict = {}
+
             # Check for battery info paths
             if not self._is_battery():
                 raise BatteryNotFound()
@@ -95,6 +95,41 @@ elif sys.platform == "linux":
         def is_fast_charge(self) -> bool:
             """ This method will check if the battery is charging fast or not (above 20 Watts)"""
 
+        def close(self) -> None:
+            """ This method will close the files that are kept open between reads"""
+
+            while self._opened_files:
+                os.close(self._opened_files.popitem()[1])
+
+        def __del__(self) -> None:
+            # The opened files dict is missing when '__init__' did not get to define it
+            if hasattr(self, "_opened_files"):
+                self.close()
+
+        def _get_file_content(self, file_path: str) -> str:
+            """ This method will read the given file path and return its whole content"""
+
+            # Open the file only on its first read, sysfs attributes are regenerated on each read from offset 0
+            file_descriptor: int | None = self._opened_files.get(file_path)
+
+            if file_descriptor is None:
+                file_descriptor = self._opened_files[file_path] = os.open(file_path, os.O_RDONLY)
+
+            try:
+                # Read from the start of the file until the end of it
+                file_content: bytes = b""
+
+                while file_chunk := os.pread(file_descriptor, 4096, len(file_content)):
+                    file_content += file_chunk
+
+                return file_content.decode()
+
+            except OSError:
+                # The attribute went away, for example the battery was removed, so open it again on the next read
+                del self._opened_files[file_path]
+                os.close(file_descriptor)
+                raise
+
         def _is_battery(self) -> bool:
             """ This method will check is there is battery or not"""
 
@@ -21,158 +21,166 @@ License: MIT
 # IMPORTS
 import sys
 import re
-import csv
+import functools
 import os
-import platform
 import subprocess
-import datetime
+import tempfile
+import threading
+import time
 from exceptions import NotSupportedDriver, NotSupportedDeviceType
 
+# DECLARE BASIC VARIABLES
+VERSION: str = "1.0.1"
+
 
 class Battery:
 
-    def __init__(self):
+    # DEFINE THE WIN32_BATTERY QUERY COMMAND AND THE POWERSHELL PATH ONCE
+    _WIN32_BATTERY_QUERY: tuple = ("WMIC", "Path", "Win32_Battery", "get")
+    _POWERSHELL_PATH: str = "C:\\Windows\\System32\\WindowsPowerShell\\v1.0\\powershell.exe"
 
-        # CHECK PLATFORM COMPATIBILITY
-        _platform = platform.system()
+    # DEFINE THE PROCESS CREATION FLAGS THAT PREVENT A CONSOLE WINDOW FROM OPENING FOR EACH TOOL CALL
+    _CREATION_FLAGS: int = getattr(subprocess, "CREATE_NO_WINDOW", 0)
 
-        # CHECK IF THE 'powercfg' is enabled
-        _powercfg_output = subprocess.check_output(["powercfg", "/L"], text=True)
+    # DEFINE THE PLUGGED STATE OF EACH 'Win32_Battery' BatteryStatus VALUE, ANY OTHER VALUE IS UNKNOWN
+    # '1' MEANS THE BATTERY IS DISCHARGING AND '2' MEANS THE SYSTEM HAS ACCESS TO AC POWER
+    _PLUGGED_BATTERY_STATUS: dict = {"1": False, "2": True}
 
-        # CHECK IF THE 'Win32_Battery' CLASS IS SUPPORTED
-        _win32_battery_output = subprocess.run(["WMIC", "Path", "Win32_Battery"],
-                                               text=True, capture_output=True).stdout.split()
+    # DEFINE THE HTML BATTERY REPORT PATH INDEPENDENTLY OF THE CURRENT WORKING DIRECTORY
+    _REPORT_PATH: str = os.path.join(os.environ.get("LOCALAPPDATA", tempfile.gettempdir()),
+                                     "BatteryPy", "battery-report.html")
 
-        if "Power" not in _powercfg_output.split():
-            raise NotSupportedDriver("powercfg")
+    # DEFINE HOW LONG A GENERATED BATTERY REPORT STAYS VALID IN SECONDS
+    _REPORT_TTL: int = 3600
 
-        if "BatteryStatus" not in _win32_battery_output:
-            raise NotSupportedDriver("Win32_Battery")
+    # DEFINE HOW LONG THE RESULT OF 'get_all_info' IS REUSED IN SECONDS
+    _ALL_INFO_TTL: float = 1.0
 
-        # CLEAR MEMORY
-        del _platform, _powercfg_output, _win32_battery_output
+    # DEFINE HOW LONG A 'Win32_Battery' PROPERTIES SNAPSHOT IS REUSED IN SECONDS
+    _WIN32_BATTERY_TTL: float = 0.5
 
-        # MAKE A BATTERY REPORT
-        _battery_report_output = subprocess.run(["powercfg", "/batteryreport"], capture_output=True).stdout.split()
+    # DEFINE THE 'get_all_info' FIELDS IN ORDER WITH THEIR FORMAT STRING (None KEEPS THE RAW VALUE),
+    # A FIELD WITHOUT A VALUE IS REPORTED AS 'Unknown'
+    _ALL_INFO_FIELDS: tuple = (('python_version', None), ('BatteryPy_version', None),
+                               ('battery_manufacturer', None), ('battery_chemistry', None),
+                               ('battery_voltage', None), ('friendly_battery_voltage', None),
+                               ('operating_system', None), ('battery_type', None),
+                               ('battery_health', "{} %"), ('design_capacity', None),
+                               ('full_charge_capacity', None), ('report_date', None))
 
-        # GET THE HTML BATTERY REPORT PATH
-        self.__battery_report_path = _battery_report_output[_battery_report_output.index(b'path') + 1] \
-            .decode("UTF-8")[:-1]
+    # DEFINE THE READABLE LABEL OF EACH 'get_all_info' FIELD USED IN THE TEXT REPORT
+    _ALL_INFO_LABELS: dict = {key: key.title().replace('_', ' ') for key, _ in _ALL_INFO_FIELDS}
 
-        # READ THE HTML BATTERY REPORT
-        with open(self.__battery_report_path, 'r') as f:
-            self.__html_content = self.__parse_html_file(f.read())
-            f.close()
+    # DEFINE THE HTML TAG PATTERN, A TAG CUT AT THE END OF THE EXTRACTED TEXT IS MATCHED TOO
+    _HTML_TAG_PATTERN: re.Pattern = re.compile(r"<[^>]*>?")
+
+    # DEFINE THE PATTERN OF THE CHARACTERS TO DROP WHEN KEEPING ONLY THE DIGITS OF A VALUE
+    _NON_DIGIT_PATTERN: re.Pattern = re.compile(r"\D")
+
+    # DEFINE THE HEADING OF THE FIRST USAGE HISTORY SECTION, EVERYTHING BatteryPy READS COMES BEFORE IT
+    _REPORT_HISTORY_ANCHOR: re.Pattern = re.compile(r"<h\d[^>]*>\s*Recent usage", re.IGNORECASE)
+
+    # DEFINE THE REPORT TABLE ROW PATTERN, IT CAPTURES A LABEL AND THE CONTENT OF THE CELL NEXT TO IT
+    _REPORT_FIELD_PATTERN: re.Pattern = re.compile(r'<span class="label">([^<]*)</span>\s*</td>\s*<td[^>]*>([^<]*)',
+                                                   re.IGNORECASE)
+
+    # DEFINE IF THE NEEDED DRIVERS WERE ALREADY FOUND, THEY DO NOT APPEAR OR DISAPPEAR AT RUNTIME
+    # SO THEY ARE CHECKED ONLY ONCE PER PROCESS
+    _drivers_checked: bool = False
+
+    # DEFINE THE LAST PARSED BATTERY REPORT AS (FILE MODIFICATION TIME, HTML CONTENT, REPORT FIELDS)
+    # SO OTHER BATTERY OBJECTS OF THE SAME PROCESS DO NOT READ AND PARSE THE SAME FILE AGAIN
+    _parsed_report: tuple | None = None
+
+    # DEFINE THE LAST SNAPSHOT OF ALL 'Win32_Battery' PROPERTIES AS (TIMESTAMP, PROPERTIES DICT)
+    # IT IS SHARED BY ALL BATTERY OBJECTS SINCE SOME GETTERS ARE STATIC METHODS
+    _win32_battery_snapshot: tuple | None = None
+
+    # DEFINE THE LOCK THAT LETS ONLY ONE THREAD TAKE A NEW SNAPSHOT WHILE THE OTHERS WAIT FOR IT
+    _win32_battery_lock = threading.Lock()
+
+    def __init__(self, force_refresh: bool = False):
+
+        # DEFINE THE 'get_all_info' CACHE AS (TIMESTAMP, INFORMATION DICT)
+        self.__all_info_cache: tuple | None = None
+
+        # CHECK THE NEEDED DRIVERS IF THEY WERE NOT FOUND BEFORE
+        if not Battery._drivers_checked:
+            self.__check_drivers()
+            Battery._drivers_checked = True
+
+        # MAKE A BATTERY REPORT ONLY IF THERE IS NO FRESH ONE ALREADY
+        if force_refresh or not self.__is_report_fresh():
+            self.__generate_battery_report()
+
+        # READ AND PARSE THE HTML BATTERY REPORT
+        self.__html_content, self.__report_fields = self.__load_battery_report()
 
         # CHECK THE DEVICE PLATFORM
         if not self.__is_mobile_platform():
-            print(self.__battery_report_path)
-            os.system(f"del {self.__battery_report_path}")
+            os.remove(self._REPORT_PATH)
             raise NotSupportedDeviceType
 
-        # CLEAR MEMORY
-        del self.__battery_report_path
+    # THE MANUFACTURER, THE CHEMISTRY AND THE TYPE NEVER CHANGE FOR A BATTERY
+    # SO THEY ARE LOOKED UP ONCE AND KEPT FOR THE LIFETIME OF THE BATTERY OBJECT
 
-    @property
+    @functools.cached_property
     def manufacturer(self) -> str | None:
         """ This method will return the battery manufacturer"""
         # GET THE BATTERY MANUFACTURER USING THE BATTERY REPORT
-        return self.__get_html_text(r'<span class="label">MANUFACTURER</span>', "MANUFACTURER")
+        return self.__get_report_field("MANUFACTURER")
 
-    @property
+    @functools.cached_property
     def chemistry(self) -> str | None:
         """ This method will return the battery chemistry"""
         # GET THE BATTERY CHEMISTRY USING THE BATTERY REPORT
-        return self.__get_html_text(r'<span class="label">CHEMISTRY</span>', "CHEMISTRY")
+        return self.__get_report_field("CHEMISTRY")
 
-    @property
+    @functools.cached_property
     def type(self) -> str | None:
         """ This method will return the device battery type"""
-        process_output = subprocess.run(["WMIC", "Path", "Win32_Battery", "get", "Caption"],
-                                        text=True, capture_output=True).stdout.split()
-        # RETURN THE BATTERY TYPE
-        return f"{process_output[1]} Battery" if len(process_output) > 0 else None
+        # RETURN THE BATTERY TYPE, THE 'Caption' PROPERTY READS LIKE 'Internal Battery'
+        return self.__query_win32_battery("Caption")
 
     @staticmethod
     def get_current_voltage(friendly_output: bool = True) -> str | int | None:
         """ This method will return the battery design voltage"""
 
-        # DEFINE EMPTY VARIABLE
-        design_voltage: str | int = -1
+        design_voltage: str | None = Battery.__query_win32_battery("DesignVoltage")
 
-        process_output = subprocess.run(["WMIC", "Path", "Win32_Battery", "get", "DesignVoltage"],
-                                        text=True, capture_output=True).stdout.split()
+        if design_voltage is None:
+            return None
 
         # GET VOLTAGE FORMAT
-        if friendly_output:
-            design_voltage = f"{int(process_output[1]) / 1000.0:.2f}v"
-
-        elif not friendly_output:
-            design_voltage = process_output[1]
-
-        # RETURN THE BATTERY VOLTAGE
-        return design_voltage if len(process_output) > 0 else None
+        return Battery.__format_voltage(design_voltage) if friendly_output else design_voltage
 
     @property
     def battery_percentage(self) -> int | None:
         """ This method will return the current battery percentage"""
 
-        # GET BATTERY STATUS
-        process_output = subprocess.run(["WMIC", "Path", "Win32_Battery", "get", "EstimatedChargeRemaining"],
-                                        text=True, capture_output=True).stdout.split()
-
-        # RETURN THE BATTERY PERCENTAGE
-        return process_output[1] if len(process_output) > 0 else None
+        # GET AND RETURN THE BATTERY PERCENTAGE
+        return self.__query_win32_battery("EstimatedChargeRemaining")
 
     @property
     def battery_health(self) -> int | None:
         """ This method will calculate and return the battery heath percentage"""
 
-        # DEFINE VARIABLES
-        design_charge_capacity: int | None = self.__design_battery_capacity()
-        full_charge_capacity: int | None = self.__full_battery_capacity()
-
-        if design_charge_capacity and full_charge_capacity is None:
-            return None
-
-        # CALCULATE BATTERY HEALTH PERCENTAGE
-        battery_health: int = int(full_charge_capacity * 100 / design_charge_capacity)
-
-        # CLEAR MEMORY
-        del design_charge_capacity, full_charge_capacity
-
-        return battery_health if battery_health <= 100 else 100
+        return self.__calculate_health(self.__design_battery_capacity(), self.__full_battery_capacity())
 
     @property
-    def is_plugged(self) -> bool:
+    def is_plugged(self) -> bool | None:
         """ This method will tell if the battery is plugged to the power or not"""
 
-        # DEFINE EMPTY PLUGGED VARIABLE
-        is_plugged: bool | None
-
-        process_output: int = int(subprocess.run(["WMIC", "Path", "Win32_Battery", "get", "BatteryStatus"],
-                                                 text=True, capture_output=True).stdout.split()[1])
-
-        if process_output == 1:
-            is_plugged = False
-
-        elif process_output == 2:
-            is_plugged = True
-
-        else:
-            is_plugged = None
-
-        # CLEAR MEMORY
-        del process_output
-
-        return is_plugged
+        # LOOK UP THE PLUGGED STATE OF THE CURRENT BATTERY STATUS
+        return self._PLUGGED_BATTERY_STATUS.get(self.__query_win32_battery("BatteryStatus"))
 
     @staticmethod
     def power_management_mode(aliased: bool = True) -> str | tuple | None:
         """ This method will return the current operating system power mode used"""
 
         # GET THE POWER MANAGEMENT MODE
-        power_mode_output = subprocess.check_output(["powercfg", "/L"], text=True).split()
+        power_mode_output = subprocess.check_output(["powercfg", "/L"], text=True,
+                                                    creationflags=Battery._CREATION_FLAGS).split()
         # Check for None output
         if 'GUID:' not in power_mode_output:
             return None
@@ -200,6 +208,16 @@ class Battery:
 
         return True if charge_rate_watts >= fast_charge_wattage else False
 
+    @staticmethod
+    def refresh_drivers_check() -> None:
+        """ This method will make the next Battery object check the needed drivers again"""
+        Battery._drivers_checked = False
+
+    def refresh_win32_battery(self) -> None:
+        """ This method will make the next getter and 'get_all_info' query the 'Win32_Battery' properties again"""
+        Battery._win32_battery_snapshot = None
+        self.__all_info_cache = None
+
     # @staticmethod
     # def get_estimated_full_charge_time(friendly_format: bool = False) -> int | str | None:
     #     """ This method will calculate the time remaining to full charge the battery in seconds"""
@@ -216,108 +234,259 @@ class Battery:
         # FORMAT THE DICTIONARY TO MAKE IT READABLE
         max_key_length: int = max(len(str(key)) for key in battery_info_dict.keys())
         max_value_length: int = max(len(str(value)) for value in battery_info_dict.values())
-        formatted_string: str = ""
-
-        with open(f"{file_path}\\BatteryPy-report.txt", 'w') as file:
-
-            for key, value in battery_info_dict.items():
-                # REFORMAT THE KEY
-                key: str = key.title().replace('_', ' ')
+        rows: list = []
 
-                key_padding: str = " " * (max_key_length - len(str(key)))
-                value_padding: str = " " * (max_value_length - len(str(value)))
+        for key, value in battery_info_dict.items():
+            # GET THE READABLE KEY
+            key: str = self._ALL_INFO_LABELS[key]
 
-                formatted_string += f"{str(key)} :{key_padding}     {str(value)}{value_padding}\n"
+            key_padding: str = " " * (max_key_length - len(str(key)))
+            value_padding: str = " " * (max_value_length - len(str(value)))
 
-            # CLEAR MEMORY
-            del (key_padding, value_padding, key, value,
-                 max_key_length, max_value_length, battery_info_dict)
+            rows.append(f"{str(key)} :{key_padding}     {str(value)}{value_padding}\n")
 
-            for row in formatted_string:
-                file.write(row)
+        # CLEAR MEMORY
+        del max_key_length, max_value_length, battery_info_dict
 
-            file.close()
+        # BUILD THE REPORT FILE PATH ONCE
+        report_path: str = os.path.join(file_path, "BatteryPy-report.txt")
 
-        # CLEAR MEMORY
-        del row, formatted_string, file
+        with open(report_path, 'w') as file:
+            # WRITE THE WHOLE REPORT WITH A SINGLE CALL
+            file.write("".join(rows))
 
         # RETURN FILE REPORT PATH
-        return f"{file_path}\\BatteryPy-report.txt"
+        return report_path
 
     def get_csv_report(self, file_path: str = os.getcwd()):
         """ This method will create a battery report in csv file"""
 
+        # IMPORT THE CSV MODULE ONLY WHEN A CSV REPORT IS REQUESTED
+        import csv
+
         battery_info_dict: dict = self.get_all_info()
 
-        with open(f"{file_path}\\BatteryPy-report.csv", 'w', newline='') as file:
+        # Build the report file path once
+        report_path: str = os.path.join(file_path, "BatteryPy-report.csv")
+
+        with open(report_path, 'w', newline='') as file:
             writer = csv.writer(file)
             writer.writerow(["Key", "Value"])  # Write Header row
 
-            for key, value in battery_info_dict.items():
-                writer.writerow([key, value])
+            # Write all the information rows with a single call
+            writer.writerows(battery_info_dict.items())
 
             file.close()
 
         # Return the file report path
-        return f"{file_path}\\BatteryPy-report.csv"
+        return report_path
 
-    def get_all_info(self) -> dict:
+    def get_all_info(self, force: bool = False) -> dict:
         """ This method will return all information that BatteryPy can retrieve"""
 
-        # DEFINE THE INFORMATION DICT
-        return {'python_version': platform.python_version(), 'BatteryPy_version': '1.0.1',
-                'battery_manufacturer': self.manufacturer, 'battery_chemistry': self.chemistry,
-                'battery_voltage': self.get_current_voltage(False),
-                'friendly_battery_voltage': self.get_current_voltage(True),
-                'operating_system': platform.system(),
-                'battery_type': self.type, 'battery_health': f"{self.battery_health} %",
-                'design_capacity': self.__design_battery_capacity(),
-                'full_charge_capacity': self.__full_battery_capacity(),
-                'report_date': datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S")}
-
-    def __design_battery_capacity(self) -> int:
+        # RETURN THE CACHED INFORMATION IF IT IS STILL FRESH
+        if not force and self.__all_info_cache is not None \
+                and time.monotonic() - self.__all_info_cache[0] < self._ALL_INFO_TTL:
+            return dict(self.__all_info_cache[1])
+
+        # IMPORT THE DATETIME AND PLATFORM MODULES ONLY WHEN A FULL REPORT IS REQUESTED
+        import datetime
+        import platform
+
+        # QUERY EACH VALUE ONCE AND DERIVE THE DEPENDENT ONES FROM IT
+        win32_battery: dict = self.__get_win32_battery_snapshot()
+        battery_voltage: str | None = win32_battery.get("DesignVoltage")
+        design_capacity: int | None = self.__design_battery_capacity()
+        full_charge_capacity: int | None = self.__full_battery_capacity()
+
+        # DEFINE THE RAW VALUE OF EACH FIELD
+        raw_values: dict = {
+            'python_version': platform.python_version(),
+            'BatteryPy_version': VERSION,
+            'battery_manufacturer': self.manufacturer,
+            'battery_chemistry': self.chemistry,
+            'battery_voltage': battery_voltage,
+            'friendly_battery_voltage': self.__format_voltage(battery_voltage) if battery_voltage is not None else None,
+            'operating_system': platform.system(),
+            'battery_type': win32_battery.get("Caption"),
+            'battery_health': self.__calculate_health(design_capacity, full_charge_capacity),
+            'design_capacity': design_capacity,
+            'full_charge_capacity': full_charge_capacity,
+            'report_date': datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
+        }
+
+        # DEFINE THE INFORMATION DICT IN THE FIELDS TABLE ORDER, A FIELD WITHOUT A RAW VALUE RAISES A 'KeyError'
+        all_info: dict = {}
+
+        for key, value_format in self._ALL_INFO_FIELDS:
+            value = raw_values[key]
+            all_info[key] = "Unknown" if value is None \
+                else (value if value_format is None else value_format.format(value))
+
+        # STORE THE INFORMATION WITH ITS TIMESTAMP
+        self.__all_info_cache = (time.monotonic(), all_info)
+
+        return dict(all_info)
+
+    def __design_battery_capacity(self) -> int | None:
         """ This method will get the design battery capacity in milliwatts-hour"""
 
         # DEFINE VARIABLES
-        design_capacity: str = ""
-        extracted_text: str = self.__get_html_text(r'<span class="label">DESIGN CAPACITY</span>')
-
-        for char in extracted_text:
-            if char.isdigit():
-                design_capacity = design_capacity + char
+        extracted_text: str = self.__get_report_field("DESIGN CAPACITY") or ""
+        design_capacity: str = self._NON_DIGIT_PATTERN.sub("", extracted_text)
 
         # CLEAR MEMORY
-        del extracted_text, char
-        return int(design_capacity)
+        del extracted_text
+
+        # THE LABEL CAN BE MISSING FROM THE REPORT, IN THAT CASE THERE ARE NO DIGITS TO CONVERT
+        return int(design_capacity) if design_capacity else None
 
-    def __full_battery_capacity(self) -> int:
+    def __full_battery_capacity(self) -> int | None:
         """ This method will get the full charge battery capacity"""
 
         # DEFINE VARIABLES
-        full_capacity: str = ""
-        extracted_text: str = self.__get_html_text(r'<span class="label">FULL CHARGE CAPACITY</span>')
-
-        for char in extracted_text:
-            if char.isdigit():
-                full_capacity = full_capacity + char
+        extracted_text: str = self.__get_report_field("FULL CHARGE CAPACITY") or ""
+        full_capacity: str = self._NON_DIGIT_PATTERN.sub("", extracted_text)
 
         # CLEAR MEMORY
-        del extracted_text, char
-        return int(full_capacity)
+        del extracted_text
+
+        # THE LABEL CAN BE MISSING FROM THE REPORT, IN THAT CASE THERE ARE NO DIGITS TO CONVERT
+        return int(full_capacity) if full_capacity else None
 
     @staticmethod
     def __get_charge_rate() -> int | None:
         """ This method will return the battery charge rate when it is charging in milli-watts"""
 
         # GET THE CHARGE RATE USING THE 'gwmi' tool
-        process_output = subprocess.run(["C:\\Windows\\System32\\WindowsPowerShell\\v1.0\\powershell.exe",
+        process_output = subprocess.run([Battery._POWERSHELL_PATH,
                                          "gwmi", "-Class", "batterystatus", "-Namespace", "root\\wmi",
                                          # "|", "Select-Object", "Property", "ChargeRate"
-                                         ], capture_output=True, text=True).stdout.split()
+                                         ], capture_output=True, text=True,
+                                         creationflags=Battery._CREATION_FLAGS).stdout.split()
 
         # RETURN THE CURRENT BATTERY CHARGE RATE
         return int(process_output[process_output.index("ChargeRate") + 2]) if "ChargeRate" in process_output else None
 
+    @staticmethod
+    def __check_drivers() -> None:
+        """ This method will check that 'powercfg' and the 'Win32_Battery' class are available"""
+
+        # CHECK IF THE 'powercfg' is enabled
+        _powercfg_output = subprocess.check_output(["powercfg", "/L"], text=True,
+                                                   creationflags=Battery._CREATION_FLAGS)
+
+        # CHECK IF THE 'Win32_Battery' CLASS IS SUPPORTED
+        _win32_battery_output = subprocess.run(["WMIC", "Path", "Win32_Battery"],
+                                               text=True, capture_output=True,
+                                               creationflags=Battery._CREATION_FLAGS).stdout.split()
+
+        if "Power" not in _powercfg_output.split():
+            raise NotSupportedDriver("powercfg")
+
+        if "BatteryStatus" not in _win32_battery_output:
+            raise NotSupportedDriver("Win32_Battery")
+
+    @staticmethod
+    def __generate_battery_report() -> None:
+        """ This method will generate the html battery report using 'powercfg'"""
+
+        # MAKE SURE THE REPORT DIRECTORY EXISTS
+        report_directory: str = os.path.dirname(Battery._REPORT_PATH)
+        os.makedirs(report_directory, exist_ok=True)
+
+        # WRITE THE REPORT INTO A UNIQUE TEMPORARY FILE FIRST, THEN MOVE IT IN PLACE SO A READER NEVER SEES
+        # A PARTIALLY WRITTEN REPORT AND PROCESSES GENERATING IT AT THE SAME TIME DO NOT SHARE A FILE
+        temp_report_handle, temp_report_path = tempfile.mkstemp(suffix=".html", dir=report_directory)
+        os.close(temp_report_handle)
+
+        try:
+            powercfg_process = subprocess.run(["powercfg", "/batteryreport", "/output", temp_report_path],
+                                              capture_output=True, creationflags=Battery._CREATION_FLAGS)
+
+            if powercfg_process.returncode != 0:
+                raise NotSupportedDriver("powercfg")
+
+            os.replace(temp_report_path, Battery._REPORT_PATH)
+
+        finally:
+            # REMOVE THE TEMPORARY FILE IF IT WAS NOT MOVED IN PLACE
+            if os.path.exists(temp_report_path):
+                os.remove(temp_report_path)
+
+    @staticmethod
+    def __load_battery_report() -> tuple:
+        """ This method will return the html body and the labeled fields of the battery report"""
+
+        report_mtime: int = os.stat(Battery._REPORT_PATH).st_mtime_ns
+
+        # REUSE THE PARSED REPORT IF THE FILE DID NOT CHANGE SINCE IT WAS PARSED
+        if Battery._parsed_report is not None and Battery._parsed_report[0] == report_mtime:
+            return Battery._parsed_report[1:]
+
+        # READ THE HTML BATTERY REPORT
+        with open(Battery._REPORT_PATH, 'r') as f:
+            html_content: str = Battery.__parse_html_file(f.read())
+            f.close()
+
+        # EXTRACT ALL THE LABELED REPORT FIELDS AT ONCE
+        report_fields: dict = Battery.__parse_report_fields(html_content)
+
+        Battery._parsed_report = (report_mtime, html_content, report_fields)
+
+        return html_content, report_fields
+
+    @staticmethod
+    def __is_report_fresh() -> bool:
+        """ This method will check if the existing html battery report is younger than the report TTL"""
+
+        # GET THE REPORT MODIFICATION TIME WITH A SINGLE 'stat' CALL
+        try:
+            report_mtime: float = os.stat(Battery._REPORT_PATH).st_mtime
+
+        except FileNotFoundError:
+            return False
+
+        return report_mtime > time.time() - Battery._REPORT_TTL
+
+    @staticmethod
+    def __query_win32_battery(property_name: str) -> str | None:
+        """ This method will return a single 'Win32_Battery' property value"""
+        return Battery.__get_win32_battery_snapshot().get(property_name)
+
+    @staticmethod
+    def __get_win32_battery_snapshot() -> dict:
+        """ This method will return all 'Win32_Battery' properties, queried again only when they are stale"""
+
+        with Battery._win32_battery_lock:
+
+            # QUERY A NEW SNAPSHOT IF THERE IS NONE OR IF IT IS TOO OLD
+            if Battery._win32_battery_snapshot is None \
+                    or time.monotonic() - Battery._win32_battery_snapshot[0] >= Battery._WIN32_BATTERY_TTL:
+                Battery._win32_battery_snapshot = (time.monotonic(), Battery.__query_win32_battery_properties())
+
+            return Battery._win32_battery_snapshot[1]
+
+    @staticmethod
+    def __query_win32_battery_properties() -> dict:
+        """ This method will query all 'Win32_Battery' properties with a single WMIC call"""
+
+        process_output: str = subprocess.run([*Battery._WIN32_BATTERY_QUERY, "/format:list"],
+                                             text=True, capture_output=True,
+                                             creationflags=Battery._CREATION_FLAGS).stdout
+
+        # DEFINE THE PROPERTIES DICT
+        properties: dict = {}
+
+        # PARSE THE 'Property=Value' LINES, KEEP THE FIRST BATTERY VALUES WHEN THERE ARE SEVERAL
+        for line in process_output.splitlines():
+            property_name, separator, value = line.strip().partition("=")
+
+            if separator and value:
+                properties.setdefault(property_name, value)
+
+        return properties
+
     def __is_mobile_platform(self) -> bool:
         """ This method will return the platform role 'Desktop' or 'Mobile'"""
 
@@ -328,6 +497,23 @@ class Battery:
         # GET SEARCH PATTERN MATCH
         return True if re.match(search_pattern, html_text_output, re.IGNORECASE) else False
 
+    @staticmethod
+    def __calculate_health(design_capacity: int | None, full_charge_capacity: int | None) -> int | None:
+        """ This method will calculate the battery health percentage from its capacities"""
+
+        if not design_capacity or full_charge_capacity is None:
+            return None
+
+        # CALCULATE BATTERY HEALTH PERCENTAGE
+        battery_health: int = int(full_charge_capacity * 100 / design_capacity)
+
+        return battery_health if battery_health <= 100 else 100
+
+    @staticmethod
+    def __format_voltage(value: str | int) -> str:
+        """ This method will format the millivolts design voltage into a friendly volts string"""
+        return f"{int(value) / 1000.0:.2f}v"
+
     @staticmethod
     def __milliwatts_to_watts(value: int) -> int:
         """ This method will convert milliwats to watts"""
@@ -337,25 +523,37 @@ class Battery:
         """ This method will convert milliwatts-hour to milliampere-hour"""
         return int(value / int(self.get_current_voltage(False)))
 
+    def __get_report_field(self, label: str) -> str | None:
+        """ This method will return the value of a labeled report field"""
+
+        if label in self.__report_fields:
+            return self.__report_fields[label] or None
+
+        # FALL BACK TO THE TEXT THAT FOLLOWS THE LABEL WHEN THE ROW LAYOUT IS NOT RECOGNIZED
+        return self.__get_html_text(f'<span class="label">{label}</span>', label).strip() or None
+
     def __get_html_text(self, search_pattern: str, info_text: str = "", _chars_count: int = 75) -> str | None:
         """ This method will extract the requested information from the body html parsed content"""
 
         # DEFINE VARIABLES
         __html_text: str
-        search_pattern_index: int = -1
 
-        # GET SEARCH PATTERN MATCH
-        search_pattern_match = re.search(search_pattern, self.__html_content, re.IGNORECASE)
+        # GET SEARCH PATTERN INDEX USING A PLAIN STRING SEARCH, THE REPORT LABELS ARE WRITTEN
+        # IN A FIXED CASE SO THE CASE-INSENSITIVE REGEX SCAN IS ONLY NEEDED AS A FALLBACK
+        search_pattern_index: int = self.__html_content.find(search_pattern)
+
+        if search_pattern_index == -1:
+            search_pattern_match = re.search(re.escape(search_pattern), self.__html_content, re.IGNORECASE)
+
+            # THE PATTERN IS NOT IN THE REPORT SO THERE IS NO TEXT TO EXTRACT
+            if not search_pattern_match:
+                return ""
 
-        if search_pattern_match:
-            search_pattern_index: int = search_pattern_match.start()
+            search_pattern_index = search_pattern_match.start()
 
         # STORE THE HTML TEXT
         __html_text: str = self.__html_content[search_pattern_index:search_pattern_index + _chars_count]
 
-        # CLEAR MEMORY
-        del search_pattern_match
-
         # CLEAR & NORMALIZE THE HTML TEXT FROM HTML TAG AND RETURN IT
         return self.__html_text_normalization(__html_text, info_text)
 
@@ -363,57 +561,48 @@ class Battery:
     def __html_text_normalization(html_text: str, info_text: str = "") -> str:
         """ This method will normalize and clean the extracted html text"""
 
-        # Define the normalized text variable
-        normalized_text: str = ""
-
-        # Implement a smple algorithm to detect and remove html tags & attributes
-        # from the html text
-        inside_tag: bool = False
-        inside_single_quote: bool = False
-        inside_double_quote: bool = False
-
-        for char in html_text:
-            if char == "<" and not inside_tag:
-                inside_tag = True
-                continue
+        # Remove the html tags & attributes from the html text and return the normalized text
+        return Battery._HTML_TAG_PATTERN.sub("", html_text).replace(info_text, "")
 
-            elif char == ">" and inside_tag:
-                inside_tag = False
-                continue
-
-            if inside_tag:
-                if char == "'" and not inside_double_quote:
-                    inside_single_quote = not inside_single_quote
+    @staticmethod
+    def __parse_report_fields(html_content: str) -> dict:
+        """ This method will extract all the labeled fields of the report tables in a single pass"""
 
-                elif char == '"' and not inside_single_quote:
-                    inside_double_quote = not inside_double_quote
+        # DEFINE THE REPORT FIELDS DICT
+        report_fields: dict = {}
 
-            else:
-                normalized_text += char
+        for label, value in Battery._REPORT_FIELD_PATTERN.findall(html_content):
+            # KEEP THE FIRST BATTERY VALUES WHEN THE DEVICE HAS MORE THAN ONE BATTERY
+            report_fields.setdefault(label.strip().upper(), value.replace("&nbsp;", " ").strip())
 
-        # Return the normalized text
-        return normalized_text.replace(info_text, "")
+        return report_fields
 
     @staticmethod
     def __parse_html_file(html_content: str) -> str:
         """ This method will extract the body section from the html content"""
 
-        # DEFINE EMPTY VARIABLE
-        body_tag_index: int = -1
-        closing_body_index: int = -1
+        # DEFINE EMPTY VARIABLES
+        body_tag_index: int = 0
+        history_anchor_match = None
 
         body_tag_match = re.search(r"<body>", html_content, re.IGNORECASE)
         if body_tag_match:
-            body_tag_index = body_tag_match.start()
+            body_tag_index = body_tag_match.end()
 
-        closing_tag_match = re.search(r"</body>", html_content, re.IGNORECASE)
+            # STOP BEFORE THE USAGE HISTORY SECTIONS, THEY MAKE UP MOST OF THE REPORT AND
+            # THE SYSTEM AND INSTALLED BATTERIES TABLES THAT WE READ COME BEFORE THEM,
+            # THE HEADING IS ONLY SEARCHED INSIDE A FOUND BODY SO THE HEAD CONTENT CAN NOT CUT IT SHORT
+            history_anchor_match = Battery._REPORT_HISTORY_ANCHOR.search(html_content, body_tag_index)
 
-        if closing_tag_match:
-            closing_body_index = closing_tag_match.start()
+        if history_anchor_match:
+            closing_body_index: int = history_anchor_match.start()
+
+        else:
+            closing_tag_match = re.search(r"</body>", html_content, re.IGNORECASE)
+            closing_body_index: int = closing_tag_match.start() if closing_tag_match else len(html_content)
 
         # RETURN THE EXTRACTED HTML BODY
-        return html_content[body_tag_index + 6:closing_body_index] if body_tag_match and closing_tag_match \
-            else html_content
+        return html_content[body_tag_index:closing_body_index]
 
 
 if __name__ == "__main__":
@@ -8,16 +8,39 @@ This file is for testing BatteryPy which we will get the battery information
 # IMPORTS
 from BatteryPy.exceptions import *
 from BatteryPy.battery_py import Battery, AUTHOR, VERSION, PLATFORM
+from concurrent.futures import ThreadPoolExecutor
 from time import perf_counter
+import ctypes
+import sys
 import os
 
+
+def enable_virtual_terminal() -> bool:
+    """ This function will enable ANSI escape sequences processing on the Windows console"""
+    kernel32 = ctypes.windll.kernel32
+    console_mode = ctypes.c_ulong()
+
+    # Get the standard output console handle and its current mode
+    stdout_handle = kernel32.GetStdHandle(-11)
+    if not kernel32.GetConsoleMode(stdout_handle, ctypes.byref(console_mode)):
+        return False
+
+    # Add the 'ENABLE_VIRTUAL_TERMINAL_PROCESSING' flag
+    return bool(kernel32.SetConsoleMode(stdout_handle, console_mode.value | 0x0004))
+
+
 # Check if the OS to apply color and title changes
 if PLATFORM == "Windows":
-    # Set terminal window title
-    os.system(f"title BatteryPy - {VERSION}")
 
-    # Change colors
-    os.system("color F0")
+    # Set terminal window title directly through the console API
+    ctypes.windll.kernel32.SetConsoleTitleW(f"BatteryPy - {VERSION}")
+
+    # Change colors to black on white and clear the screen with ANSI sequences,
+    # fall back to the 'color' command on consoles that do not support them
+    if enable_virtual_terminal():
+        sys.stdout.write("\033[30;107m\033[2J\033[H")
+    else:
+        os.system("color F0")
 
 # Print the software header
 print(f"\n{' ' * 5}[ BatteryPy - v{VERSION}{' ' * 5}|{' '*5} Developed by {AUTHOR} ]\n\n")
@@ -29,33 +52,50 @@ def main():
     # Create the Battery object
     battery = Battery()
 
-    # Print out all battery information
-    print(f"  Battery manufacturer  :   {battery.manufacturer}\n")
-    # Get the Battery manufacturer name
+    # Query the values that wait on a system tool concurrently.
+    # The 'Win32_Battery' values share one WMIC query, so they are read in one task.
+    # The fast charge state and the power mode each run their own tool.
+    # The other values come from the already parsed battery report.
+    with ThreadPoolExecutor() as executor:
+        win32_battery_values = executor.submit(lambda: (battery.type, battery.battery_percentage,
+                                                        battery.is_plugged, battery.get_current_voltage()))
+        is_fast_charging = executor.submit(lambda: battery.is_fast_charging)
+        power_mode = executor.submit(battery.power_management_mode, aliased=True)
+
+    battery_type, battery_percentage, is_plugged, battery_voltage = win32_battery_values.result()
+
+    # Collect all battery information lines
+    info_lines: list = [
+        # Get the Battery manufacturer name
+        f"  Battery manufacturer  :   {battery.manufacturer}\n",
 
-    print(f"  Battery Type          :   {battery.type}\n")
-    # Get the battery type (Internal Battery or external)
+        # Get the battery type (Internal Battery or external)
+        f"  Battery Type          :   {battery_type}\n",
 
-    print(f"  Battery Chemistry     :   {battery.chemistry}\n")
-    # Get the Battery chemistry technology (Lithium-Ion in most cases)
+        # Get the Battery chemistry technology (Lithium-Ion in most cases)
+        f"  Battery Chemistry     :   {battery.chemistry}\n",
 
-    print(f"  Battery Charge        :   {battery.battery_percentage}%\n")
-    # Get the battery percentage (charging level)
+        # Get the battery percentage (charging level)
+        f"  Battery Charge        :   {battery_percentage}%\n",
 
-    print(f"  Battery Health        :   {battery.battery_health}%\n")
-    # Get the battery health or battery maximum capacity in percentage
+        # Get the battery health or battery maximum capacity in percentage
+        f"  Battery Health        :   {battery.battery_health}%\n",
 
-    print(f"  Is Fast Charge ?      :   {'YES' if battery.is_fast_charging else 'NO'}\n")
-    # tells if the battery is fast charging or not
+        # tells if the battery is fast charging or not
+        f"  Is Fast Charge ?      :   {'YES' if is_fast_charging.result() else 'NO'}\n",
 
-    print(f"  Is Charging ?         :   {'YES' if battery.is_plugged else 'NO'}\n")
-    # tells if the battery is plugged to the power source
+        # tells if the battery is plugged to the power source
+        f"  Is Charging ?         :   {'YES' if is_plugged else 'NO'}\n",
 
-    print(f"  Battery Voltage       :   {battery.get_current_voltage()}\n")
-    # Get the current battery output voltage
+        # Get the current battery output voltage
+        f"  Battery Voltage       :   {battery_voltage}\n",
 
-    print(f"  Power Mode            :   {battery.power_management_mode(aliased=True)}\n")
-    # Get the power management mode is it 'balanced' or 'performance' or 'economy'
+        # Get the power management mode is it 'balanced' or 'performance' or 'economy'
+        f"  Power Mode            :   {power_mode.result()}\n",
+    ]
+
+    # Print out all battery information with a single write
+    sys.stdout.write("".join(f"{line}\n" for line in info_lines))
 
 
 if __name__ == "__main__":
@@ -76,7 +116,4 @@ if __name__ == "__main__":
     except NotSupportedDriver:
         print("\n   BatteryPy can not reach the needed driver to run.\n")
 
-    # remove the report html file
-    os.system("del battery-report.html")
-
     input("  PRESS ENTER TO QUIT .")